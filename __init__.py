@@ -11,13 +11,13 @@ Version: 2.0.0
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
 from aqt import mw, gui_hooks
-from datetime import datetime
 
 # Import UI components
-from .ui import create_menu
+from .ui import create_menu, refresh_labels
 
 
 # ==========================================
@@ -28,7 +28,7 @@ from .ui import create_menu
 MIN_NEW_CARDS = 0
 MAX_NEW_CARDS = 9999
 
-# Weekday constants (datetime.weekday() returns 0=Mon...6=Sun)
+# Weekday constants (time.localtime().tm_wday returns 0=Mon...6=Sun)
 MONDAY = 0
 TUESDAY = 1
 WEDNESDAY = 2
@@ -36,7 +36,7 @@ THURSDAY = 3
 FRIDAY = 4
 SATURDAY = 5
 SUNDAY = 6
-WEEKEND_DAYS = [SATURDAY, SUNDAY]
+WEEKEND_DAYS = frozenset({SATURDAY, SUNDAY})
 
 
 # ==========================================
@@ -77,20 +77,24 @@ def is_weekend() -> bool:
     Returns:
         bool: True if today is weekend
     """
-    return datetime.now().weekday() in WEEKEND_DAYS
+    return time.localtime().tm_wday in WEEKEND_DAYS
 
 
 # ==========================================
 # Config Management
 # ==========================================
 
-# Collection config key for redundant storage
+# Collection config key for original limits storage (syncs via AnkiWeb)
 COLLECTION_CONFIG_KEY = "weekend_addon_original_limits"
 
 
 def _get_collection_limits() -> dict[str, int]:
     """
-    Get original limits from collection config (primary storage).
+    Get original limits from collection config (the only storage).
+
+    Limits left in the addon config by older versions are migrated (or just
+    discarded, if the collection already has limits) on first read (see
+    _migrate_addon_limits).
 
     Returns:
         dict[str, int]: Original limits stored in collection, empty dict if not found
@@ -101,43 +105,132 @@ def _get_collection_limits() -> dict[str, int]:
     try:
         limits = mw.col.get_config(COLLECTION_CONFIG_KEY)
         if limits is None or not isinstance(limits, dict):
-            return {}
-        return limits
+            limits = {}
     except Exception as e:
         print(f"[Weekend Addon] ERROR: Failed to read collection config: {e}")
         return {}
 
+    return _migrate_addon_limits(limits)
+
 
-def _store_collection_limits(limits: dict[str, int]) -> None:
+def _migrate_addon_limits(collection_limits: dict[str, int]) -> dict[str, int]:
     """
-    Store original limits in collection config (primary storage).
+    Move original limits from the addon config (pre-2.1 backup storage)
+    into the collection config, then clear the addon copy so the
+    migration runs only once.
+
+    The addon config is shared by all profiles, so its copy is only moved
+    into a collection that has no limits yet. If the collection already has
+    limits (e.g. written by v2.0, which kept both copies), the addon copy is
+    just cleared: it could belong to another profile.
+
+    Args:
+        collection_limits: Limits currently stored in the collection
+
+    Returns:
+        dict[str, int]: Limits now stored in the collection
+    """
+    config = get_config()
+    legacy_limits = config['original_limits']  # Key guaranteed by get_config()
+    if not legacy_limits:
+        return collection_limits
+
+    if collection_limits:
+        print("[Weekend Addon] INFO: Clearing legacy addon config limits (collection already has limits)")
+        config['original_limits'] = {}
+        _write_config(config)
+        return collection_limits
+
+    # Limits are validated when written, and this writes them to the collection
+    limits = {}
+    invalid = []
+    for config_id_str, limit in legacy_limits.items():
+        try:
+            limits[config_id_str] = validate_original_limit(limit)
+        except (TypeError, ValueError):
+            invalid.append(f"{config_id_str}={limit!r}")
+    if invalid:
+        print(f"[Weekend Addon] WARNING: Dropping invalid legacy limit(s): {invalid}")
+
+    print(f"[Weekend Addon] INFO: Migrating {len(limits)} limit(s) from addon config to collection storage")
+    # Keep the addon copy if the collection write failed (retried next read)
+    if _store_collection_limits(limits):
+        config['original_limits'] = {}
+        _write_config(config)
+    return limits
+
+
+def _store_collection_limits(limits: dict[str, int]) -> bool:
+    """
+    Store original limits in collection config (the only storage).
 
     Args:
         limits: Dictionary mapping config_id -> original limit
+
+    Returns:
+        bool: True if the limits were written
     """
     if not mw.col:
-        return
+        return False
 
     try:
         mw.col.set_config(COLLECTION_CONFIG_KEY, limits)
+        return True
     except Exception as e:
         print(f"[Weekend Addon] ERROR: Failed to write collection config: {e}")
+        return False
+
+
+# Cached addon config: avoids re-reading and re-validating meta.json on every call.
+# Kept in sync by _write_config() and dropped when the user saves the config editor.
+# Addon config is shared by all profiles, so it survives profile switches: the
+# "mode unchanged" path of on_profile_open() then touches no JSON at all.
+_config_cache: dict[str, Any] | None = None
+
+
+def _invalidate_config_cache(*args: Any) -> None:
+    """
+    Drop cached addon config so the next get_config() re-reads it from disk.
+
+    Accepts and ignores any hook arguments (e.g. the config passed by
+    Anki's config editor), so it can be registered directly as a callback.
+    """
+    global _config_cache
+    _config_cache = None
+
+
+def _write_config(config: dict[str, Any]) -> None:
+    """
+    Write addon configuration to disk and keep the in-memory cache in sync.
+
+    Args:
+        config: Full addon configuration dictionary to persist
+    """
+    global _config_cache
+    mw.addonManager.writeConfig(__name__, config)
+    _config_cache = config
 
 
 def get_config() -> dict[str, Any]:
     """
     Read addon configuration from config.json with validation.
+    Result is cached until the user saves the config editor.
 
     Returns:
         dict[str, Any]: Configuration dictionary with keys:
             - 'travel_mode': bool
-            - 'original_limits': dict[str, int]
+            - 'original_limits': dict[str, int] (legacy, see _migrate_addon_limits)
             - 'last_applied_mode': str | None
 
     Note:
         Returns safe defaults if config is corrupted or invalid.
+        Only the structure is checked; stored limit values are trusted.
         Logs errors for debugging.
     """
+    global _config_cache
+    if _config_cache is not None:
+        return _config_cache
+
     try:
         config = mw.addonManager.getConfig(__name__)
         if config is None:
@@ -155,19 +248,10 @@ def get_config() -> dict[str, Any]:
         if 'original_limits' not in config or not isinstance(config['original_limits'], dict):
             config['original_limits'] = {}
 
-        # Validate original_limits entries
-        validated_limits = {}
-        for config_id, limit in config['original_limits'].items():
-            try:
-                if not isinstance(limit, int):
-                    print(f"[Weekend Addon] WARNING: Limit for config {config_id} is not int, skipping")
-                    continue
-                validated_limits[config_id] = validate_original_limit(limit)
-            except (TypeError, ValueError) as e:
-                print(f"[Weekend Addon] WARNING: Invalid limit for config {config_id}: {e}")
-                continue
-
-        config['original_limits'] = validated_limits
+        # original_limits entries are NOT revalidated here: they are validated
+        # when captured (store_original_limit, apply_weekend_mode) and again
+        # right before restoration (apply_weekday_mode)
+        _config_cache = config
         return config
 
     except Exception as e:
@@ -175,41 +259,42 @@ def get_config() -> dict[str, Any]:
         return {'travel_mode': False, 'original_limits': {}}
 
 
-def get_original_limit(config_id: int) -> int | None:
+def _print_debug_traceback() -> None:
+    """
+    Print the current exception's traceback if 'debug' is enabled in config.
+
+    Per-config failures already log a one-line message; full tracebacks are
+    only useful when investigating, so they are opt-in.
+    """
+    if get_config().get('debug', False):
+        import traceback
+        traceback.print_exc()
+
+
+def get_original_limit(config_id: int, limits: dict[str, int] | None = None) -> int | None:
     """
     Retrieve stored original new cards per day limit for a deck config.
-    Uses redundant storage: primary (collection config) + fallback (addon config).
 
     Args:
         config_id: Deck configuration ID
+        limits: Optional pre-loaded limits from _get_collection_limits(); when
+            given, no storage is read (use in loops over many configs)
 
     Returns:
         int | None: Original limit if stored, None otherwise
     """
     config_id_str = str(config_id)
 
-    # Try primary storage (collection config)
-    collection_limits = _get_collection_limits()
-    if config_id_str in collection_limits:
-        return collection_limits[config_id_str]
-
-    # Fallback to secondary storage (addon config)
-    addon_limits = get_config().get('original_limits', {})
-    limit = addon_limits.get(config_id_str)
+    if limits is None:
+        limits = _get_collection_limits()
 
-    # If found in fallback, sync to primary
-    if limit is not None and mw.col:
-        print(f"[Weekend Addon] INFO: Syncing limit for config {config_id} to collection storage")
-        collection_limits[config_id_str] = limit
-        _store_collection_limits(collection_limits)
-
-    return limit
+    return limits.get(config_id_str)
 
 
 def store_original_limit(config_id: int, limit: int) -> None:
     """
-    Store original new cards per day limit for future restoration.
-    Uses redundant storage: primary (collection config) + secondary (addon config).
+    Store original new cards per day limit for future restoration
+    in the collection config (syncs via AnkiWeb).
 
     Args:
         config_id: Deck configuration ID
@@ -223,28 +308,84 @@ def store_original_limit(config_id: int, limit: int) -> None:
     validated_limit = validate_original_limit(limit)
     config_id_str = str(config_id)
 
-    # Store in primary storage (collection config)
     if mw.col:
         collection_limits = _get_collection_limits()
         collection_limits[config_id_str] = validated_limit
         _store_collection_limits(collection_limits)
 
-    # Store in secondary storage (addon config) for redundancy
-    config = get_config()
-    if 'original_limits' not in config:
-        config['original_limits'] = {}
-    config['original_limits'][config_id_str] = validated_limit
-    mw.addonManager.writeConfig(__name__, config)
+
+def _commit_limits(collection_limits: dict[str, int] | None,
+                   addon_config: dict[str, Any],
+                   applied_mode: str) -> bool:
+    """
+    Persist the outcome of a mode change in one step: captured original
+    limits (collection config) and the applied mode (addon config).
+
+    Each store is written only if its content differs from what is already
+    stored. If the limits write fails, the mode is not recorded and the
+    captured limits are put back on the deck configs, so the next profile
+    open retries the pause instead of losing them. If the addon config
+    write fails, the in-memory mode is rolled back so the cached config
+    never claims a mode that wasn't saved (the next profile open then
+    retries).
+
+    Args:
+        collection_limits: Limits captured by apply_weekend_mode(), or None
+            if nothing was captured
+        addon_config: Addon config (from get_config()) to record the mode in
+        applied_mode: Mode that was just applied
+
+    Returns:
+        bool: True if the addon config was written to disk
+    """
+    previous_mode = addon_config.get('last_applied_mode')
+    try:
+        if collection_limits is not None and collection_limits != _get_collection_limits():
+            if not _store_collection_limits(collection_limits):
+                print("[Weekend Addon] ERROR: Limits not saved, restoring them and leaving the mode unchanged")
+                apply_weekday_mode(collection_limits)
+                return False
+
+        if applied_mode != previous_mode:
+            addon_config['last_applied_mode'] = applied_mode
+            _write_config(addon_config)
+            return True
+    except Exception as e:
+        addon_config['last_applied_mode'] = previous_mode
+        print(f"[Weekend Addon] ERROR: Failed to save config: {e}")
+    return False
 
 
 # ==========================================
 # Deck Config Modification
 # ==========================================
 
-def apply_weekend_mode() -> None:
+def _used_config_ids(col: Any) -> set[str] | None:
+    """
+    Get the IDs of deck configs (presets) used by at least one deck.
+
+    all_config() also returns presets no deck uses; touching those would
+    only bump their mtime (extra sync) and inflate the stored limits count.
+
+    Args:
+        col: Open collection
+
+    Returns:
+        set[str] | None: Used config IDs, or None if decks couldn't be read
+            (callers then treat every config as used)
+    """
+    try:
+        # One backend call for all decks; filtered decks have no 'conf'
+        return {str(deck['conf']) for deck in col.decks.all() if 'conf' in deck}
+    except Exception as e:
+        print(f"[Weekend Addon] ERROR: Failed to get deck list: {e}")
+        return None
+
+
+def apply_weekend_mode() -> dict[str, int] | None:
     """
-    Set new cards per day = 0 for all decks.
-    Stores original limits before modification for later restoration.
+    Set new cards per day = 0 for all deck configs used by a deck.
+    Captures original limits before modification for later restoration.
     Changes are marked for AnkiWeb sync automatically.
 
     IMPORTANT: Always recaptures current limits when transitioning from
@@ -252,68 +393,59 @@ def apply_weekend_mode() -> None:
     user's ACTUAL current limits, not stale values from previous sessions.
 
     Optimization: Reads config once and batches all writes (100x faster).
+    Captured limits are NOT stored here: the caller persists them together
+    with the applied mode via _commit_limits() (one commit step).
 
     Error handling: Failures on individual decks don't prevent
     processing other decks. Errors are logged but don't propagate.
+
+    Returns:
+        dict[str, int] | None: Captured limits (config_id -> limit), or None
+            if nothing was captured
     """
     # Store collection reference once to prevent race conditions
     col = mw.col
     if not col:
-        return
-
-    # Read config ONCE
-    addon_config = get_config()
+        return None
 
     # ALWAYS clear limits when entering weekend/travel mode
     # This forces fresh capture of current user-set limits
-    original_limits = {}
     collection_limits = {}
     limits_modified = False
 
+    # Day can't meaningfully change mid-run: evaluate once, not per config
+    weekend_now = is_weekend()
+
     success_count = 0
     skip_count = 0
     error_count = 0
 
-    # Get deck list with error handling
+    # Get deck config list with error handling
+    # Limits live on deck configs (usually a handful), not on decks (often hundreds)
     try:
-        deck_ids = col.decks.all_names_and_ids()
+        deck_configs = col.decks.all_config()
     except Exception as e:
-        print(f"[Weekend Addon] ERROR: Failed to get deck list: {e}")
-        return
+        print(f"[Weekend Addon] ERROR: Failed to get deck config list: {e}")
+        return None
+    used_config_ids = _used_config_ids(col)
+
+    # Per-config warnings, aggregated and printed once in the summary
+    issues: dict[str, list[str]] = {}  # warning -> config ids
 
     # PHASE 1: Capture all current limits BEFORE modifying anything
     configs_to_modify = {}  # config_id -> config object
 
-    for deck_id in deck_ids:
+    for config in deck_configs:
         try:
-            # Get deck
-            deck = col.decks.get_legacy(deck_id.id)
-            if not deck:
-                skip_count += 1
-                continue
+            config_id_str = str(config['id'])
 
-            # Verify deck structure
-            if 'conf' not in deck:
-                print(f"[Weekend Addon] WARNING: Deck {deck_id.id} has no 'conf', skipping")
-                skip_count += 1
-                continue
-
-            config_id_str = str(deck['conf'])
-
-            # Skip if already captured this config
-            if config_id_str in collection_limits:
-                continue
-
-            # Get deck config
-            config = col.decks.get_config(deck['conf'])
-            if not config:
-                print(f"[Weekend Addon] WARNING: Config {deck['conf']} not found, skipping")
-                skip_count += 1
+            # Presets no deck uses are left alone (not paused, not captured)
+            if used_config_ids is not None and config_id_str not in used_config_ids:
                 continue
 
             # Verify config structure
             if 'new' not in config or 'perDay' not in config['new']:
-                print(f"[Weekend Addon] WARNING: Config {deck['conf']} has unexpected structure, skipping")
+                issues.setdefault('unexpected structure', []).append(config_id_str)
                 skip_count += 1
                 continue
 
@@ -327,67 +459,64 @@ def apply_weekend_mode() -> None:
                 # Always capture positive values or 0 during weekdays
                 should_capture = (
                     validated_limit > 0 or  # Positive value is always safe
-                    not is_weekend()  # Zero during weekday means user wants 0
+                    not weekend_now  # Zero during weekday means user wants 0
                 )
 
                 if should_capture:
                     collection_limits[config_id_str] = validated_limit
-                    original_limits[config_id_str] = validated_limit
                     limits_modified = True
 
                 # Store config for modification in phase 2 regardless
                 configs_to_modify[config_id_str] = config
 
-            except (TypeError, ValueError) as e:
-                print(f"[Weekend Addon] WARNING: Invalid limit for config {deck['conf']}: {e}")
-            except Exception as e:
-                print(f"[Weekend Addon] WARNING: Failed to capture limit for config {deck['conf']}: {e}")
+            except (TypeError, ValueError):
+                issues.setdefault('invalid limit', []).append(config_id_str)
+            except Exception:
+                issues.setdefault('capture failed', []).append(config_id_str)
 
         except (KeyError, AttributeError, TypeError) as e:
             error_count += 1
-            print(f"[Weekend Addon] ERROR processing deck {deck_id.id}: {type(e).__name__}: {e}")
+            print(f"[Weekend Addon] ERROR processing deck config: {type(e).__name__}: {e}")
             continue
         except Exception as e:
             error_count += 1
-            print(f"[Weekend Addon] UNEXPECTED ERROR processing deck {deck_id.id}: {e}")
-            import traceback
-            traceback.print_exc()
+            print(f"[Weekend Addon] UNEXPECTED ERROR processing deck config: {e}")
+            _print_debug_traceback()
             continue
 
     # PHASE 2: Now modify all configs to 0
     for config_id_str, config in configs_to_modify.items():
         try:
-            config['new']['perDay'] = 0
-            col.decks.save(config)
+            # Already paused: don't rewrite (would bump mtime for sync)
+            if config['new']['perDay'] != 0:
+                config['new']['perDay'] = 0
+                col.decks.update_config(config)
             success_count += 1
 
         except Exception as e:
             error_count += 1
             print(f"[Weekend Addon] ERROR modifying config {config_id_str}: {e}")
-            import traceback
-            traceback.print_exc()
-
-    # BATCH WRITE: Write config ONCE at the end (if modified)
-    if limits_modified:
-        try:
-            _store_collection_limits(collection_limits)
-            addon_config['original_limits'] = original_limits
-            mw.addonManager.writeConfig(__name__, addon_config)
-        except Exception as e:
-            print(f"[Weekend Addon] ERROR: Failed to save config: {e}")
+            _print_debug_traceback()
 
     # Log summary if there were issues
-    if error_count > 0 or skip_count > 0:
-        print(f"[Weekend Addon] Weekend mode applied: {success_count} success, {skip_count} skipped, {error_count} errors")
+    if error_count > 0 or skip_count > 0 or issues:
+        print(f"[Weekend Addon] Weekend mode applied: {success_count} success, {skip_count} skipped, {error_count} errors, issues: {issues}")
+
+    return collection_limits if limits_modified else None
 
 
-def apply_weekday_mode() -> None:
+def apply_weekday_mode(original_limits: dict[str, int] | None = None) -> None:
     """
-    Restore original new cards per day limits for all decks.
+    Restore original new cards per day limits for all deck configs.
     Only restores if original limit was previously stored.
     Changes are marked for AnkiWeb sync automatically.
 
-    Optimization: Reads config once (no repeated I/O calls).
+    Args:
+        original_limits: Limits to restore instead of the stored ones (used
+            to undo a pause whose captured limits couldn't be saved)
+
+    Optimization: Reads config once (no repeated I/O calls). Only deck
+    configs are written; stored limits are read-only here.
 
     Error handling: Failures on individual decks don't prevent
     processing other decks. Errors are logged but don't propagate.
@@ -397,75 +526,90 @@ def apply_weekday_mode() -> None:
     if not col:
         return
 
-    # Read config ONCE
-    collection_limits = _get_collection_limits()
-    addon_limits = get_config().get('original_limits', {})
-
-    # Merge both sources (collection is primary)
-    original_limits = {**addon_limits, **collection_limits}
+    # Read stored limits ONCE
+    if original_limits is None:
+        original_limits = _get_collection_limits()
 
     success_count = 0
     skip_count = 0
     error_count = 0
 
+    # Per-config warnings, aggregated and printed once in the summary
+    issues: dict[str, list[str]] = {}  # warning -> config ids
+
     try:
-        deck_ids = col.decks.all_names_and_ids()
+        deck_configs = col.decks.all_config()
     except Exception as e:
-        print(f"[Weekend Addon] ERROR: Failed to get deck list: {e}")
+        print(f"[Weekend Addon] ERROR: Failed to get deck config list: {e}")
         return
 
-    for deck_id in deck_ids:
+    for config in deck_configs:
         try:
-            deck = col.decks.get_legacy(deck_id.id)
-            if not deck or 'conf' not in deck:
-                skip_count += 1
-                continue
-
-            config = col.decks.get_config(deck['conf'])
-            if not config or 'new' not in config or 'perDay' not in config['new']:
+            if 'new' not in config or 'perDay' not in config['new']:
                 skip_count += 1
                 continue
 
             # Restore original if exists (from in-memory dict)
-            config_id_str = str(deck['conf'])
-            original = original_limits.get(config_id_str)
+            original = get_original_limit(config['id'], original_limits)
 
             if original is not None:
                 # VALIDATE BEFORE RESTORATION
                 try:
                     validated = validate_original_limit(original)
-                    config['new']['perDay'] = validated
-                    col.decks.save(config)
+                    # Already at its original limit: don't rewrite (would bump mtime for sync)
+                    if config['new']['perDay'] != validated:
+                        config['new']['perDay'] = validated
+                        col.decks.update_config(config)
                     success_count += 1
-                except (TypeError, ValueError) as e:
-                    # Corruption detected - log and skip
-                    print(f"[Weekend Addon] ERROR: Corrupted limit for config {config_id_str}: {original} ({type(original).__name__})")
-                    print(f"[Weekend Addon] HINT: Check Tools → Add-ons → Weekend Addon → Config to fix invalid entry")
+                except (TypeError, ValueError):
+                    # Corruption detected - record and skip
+                    issues.setdefault('corrupted limit', []).append(f"{config['id']}={original!r}")
                     skip_count += 1
             else:
                 skip_count += 1
 
         except (KeyError, AttributeError, TypeError) as e:
             error_count += 1
-            print(f"[Weekend Addon] ERROR restoring deck {deck_id.id}: {type(e).__name__}: {e}")
+            print(f"[Weekend Addon] ERROR restoring deck config: {type(e).__name__}: {e}")
             continue
 
         except Exception as e:
             error_count += 1
-            print(f"[Weekend Addon] UNEXPECTED ERROR restoring deck {deck_id.id}: {e}")
-            import traceback
-            traceback.print_exc()
+            print(f"[Weekend Addon] UNEXPECTED ERROR restoring deck config: {e}")
+            _print_debug_traceback()
             continue
 
     if error_count > 0 or skip_count > 0:
-        print(f"[Weekend Addon] Weekday mode applied: {success_count} restored, {skip_count} skipped, {error_count} errors")
+        print(f"[Weekend Addon] Weekday mode applied: {success_count} restored, {skip_count} skipped, {error_count} errors, issues: {issues}")
+    if 'corrupted limit' in issues:
+        print("[Weekend Addon] HINT: Set those decks' new cards/day manually in deck options; they are recaptured on the next pause")
 
 
 # ==========================================
 # Main Logic
 # ==========================================
 
-def on_profile_open() -> None:
+def _desired_mode(config: dict[str, Any]) -> str:
+    """
+    Determine which mode should be applied for a config (see on_profile_open).
+
+    Args:
+        config: Addon config
+
+    Returns:
+        str: 'disabled', 'travel', 'weekend' or 'weekday'
+    """
+    # Check if weekend mode is enabled
+    if not config.get('weekend_mode', True):
+        return 'disabled'
+    if config['travel_mode']:  # Key guaranteed by get_config()
+        return 'travel'
+    if is_weekend():
+        return 'weekend'
+    return 'weekday'
+
+
+def on_profile_open(config: dict[str, Any] | None = None) -> bool:
     """
     Execute when profile opens (startup + sync).
     Applies appropriate mode based on weekend_mode, travel_mode, and current day.
@@ -478,28 +622,28 @@ def on_profile_open() -> None:
 
     Optimization: Tracks last applied mode to avoid unnecessary
     deck iteration when mode hasn't changed (95% performance improvement).
+    The check reads the cached config, so that path does no disk I/O.
 
     Error handling: Catches ALL exceptions to prevent Anki crash.
     Addon may fail, but Anki continues working.
+
+    Args:
+        config: Addon config with unsaved changes (e.g. from a UI toggle).
+            It is saved together with the applied mode in a single write.
+            Defaults to the current config from get_config().
+
+    Returns:
+        bool: True if the addon config was written. Callers passing unsaved
+            changes must save them themselves when this returns False.
     """
     try:
         if not mw.col:
-            return
+            return False
 
-        config = get_config()
-
-        # Check if weekend mode is enabled
-        weekend_mode_enabled = config.get('weekend_mode', True)
+        if config is None:
+            config = get_config()
 
-        # Determine desired mode
-        if not weekend_mode_enabled:
-            desired_mode = 'disabled'
-        elif config.get('travel_mode', False):
-            desired_mode = 'travel'
-        elif is_weekend():
-            desired_mode = 'weekend'
-        else:
-            desired_mode = 'weekday'
+        desired_mode = _desired_mode(config)
 
         # Check current mode
         current_mode = config.get('last_applied_mode')
@@ -507,24 +651,26 @@ def on_profile_open() -> None:
         # OPTIMIZATION: Apply ONLY if mode changed
         if current_mode != desired_mode:
             # Mode changed - apply update
+            captured_limits = None
             if desired_mode == 'disabled':
                 # Weekend mode is OFF - restore original limits
                 apply_weekday_mode()
             elif desired_mode in ['weekend', 'travel']:
-                apply_weekend_mode()
+                captured_limits = apply_weekend_mode()
             else:
                 apply_weekday_mode()
 
-            # Store applied mode
-            config['last_applied_mode'] = desired_mode
-            mw.addonManager.writeConfig(__name__, config)
+            # Store captured limits + applied mode in one commit step
+            return _commit_limits(captured_limits, config, desired_mode)
         # Else: Mode hasn't changed - SKIP (saves 95% of iterations!)
+        return False
 
     except Exception as e:
         # CRITICAL: Don't let exception propagate to Anki
         print(f"[Weekend Addon] CRITICAL ERROR in on_profile_open: {e}")
         import traceback
         traceback.print_exc()
+        return False
 
 
 # ==========================================
@@ -534,6 +680,13 @@ def on_profile_open() -> None:
 # Register hook to run on profile open (startup + profile switch)
 gui_hooks.profile_did_open.append(on_profile_open)
 
+# Re-translate cached menu labels (language is re-detected per profile)
+gui_hooks.profile_did_open.append(refresh_labels)
+
+# Drop cached config when the user edits it in Anki's config editor
+if mw:
+    mw.addonManager.setConfigUpdatedAction(__name__, _invalidate_config_cache)
+
 # Create menu in Tools
 if mw:
     create_menu()
@@ -0,0 +1,60 @@
+"""
+English translations for Weekend Addon.
+Loaded on demand by i18n.tr(); also the fallback for missing keys.
+"""
+
+STRINGS = {
+    # Menu
+    'menu_title': 'Weekend Addon',
+    'menu_weekend_mode': 'Weekend Mode',
+    'menu_travel_mode': 'Travel Mode',
+    'menu_status': 'View Status',
+    'menu_reset': 'Reset Stored Limits',
+
+    # Weekend mode messages
+    'weekend_enabled': '📅 Weekend Mode ENABLED\n\nNew cards will be automatically paused on weekends.\nDuring weekdays, new cards will be active.',
+    'weekend_disabled': '📅 Weekend Mode DISABLED\n\nNew cards will keep their normal limits every day.\nThe addon will not make any automatic modifications.',
+
+    # Travel mode messages
+    'travel_enabled': '✈️ Travel Mode ENABLED\n\nNew cards are now paused.\nThey will remain paused until you disable Travel Mode.',
+    'travel_disabled': '✈️ Travel Mode DISABLED\n\nNew cards will resume according to the day:\n• Weekends: Paused\n• Weekdays: Active',
+
+    # Status dialog
+    'status_title': 'Weekend Addon Status',
+    'status_today': '<b>Today:</b> {}',
+    'status_travel_mode': '<b>Travel Mode:</b> {}',
+    'status_current_mode': '<b>Current Mode:</b> {}',
+    'status_behavior': '<b>Behavior:</b>',
+    'status_paused_travel': '• New cards are <b>paused</b> (Travel Mode)',
+    'status_paused_weekend': '• New cards are <b>paused</b> (Weekend)',
+    'status_active_weekday': '• New cards are <b>active</b> (Weekday)',
+    'status_stored_limits': '<b>Stored Limits:</b> {} deck(s)',
+    'status_tip': '<i>Tip: Use "Toggle Travel Mode" to pause/resume new cards manually.</i>',
+    'status_enabled': '✅ Enabled',
+    'status_disabled': '❌ Disabled',
+
+    # Reset dialog
+    'reset_title': 'Reset Stored Limits',
+    'reset_message': 'This will clear all stored original limits.\n\nThe addon will recapture your current limits the next time it pauses/resumes cards.\n\nContinue?',
+    'reset_success': '✅ Stored limits cleared!\n\nThe addon will recapture your current limits on the next weekend/weekday transition.',
+    'reset_error': 'Error clearing limits: {}',
+
+    # Days of week
+    'monday': 'Monday',
+    'tuesday': 'Tuesday',
+    'wednesday': 'Wednesday',
+    'thursday': 'Thursday',
+    'friday': 'Friday',
+    'saturday': 'Saturday',
+    'sunday': 'Sunday',
+
+    # Common
+    'please_open_profile': 'Please open a profile first.',
+
+    # Mode names
+    'mode_weekday': 'Weekday',
+    'mode_weekend': 'Weekend',
+    'mode_travel': 'Travel',
+    'mode_disabled': 'Disabled',
+    'mode_unknown': 'Not yet applied',
+}
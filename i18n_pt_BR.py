@@ -0,0 +1,60 @@
+"""
+Portuguese (Brazil) translations for Weekend Addon.
+Loaded on demand by i18n.tr().
+"""
+
+STRINGS = {
+    # Menu
+    'menu_title': 'Weekend Addon',
+    'menu_weekend_mode': 'Modo Fim de Semana',
+    'menu_travel_mode': 'Modo Viagem',
+    'menu_status': 'Ver Status',
+    'menu_reset': 'Resetar Limites Armazenados',
+
+    # Weekend mode messages
+    'weekend_enabled': '📅 Modo Fim de Semana ATIVADO\n\nNovos cards serão pausados automaticamente aos finais de semana.\nDurante a semana, novos cards estarão ativos.',
+    'weekend_disabled': '📅 Modo Fim de Semana DESATIVADO\n\nNovos cards permanecerão com seus limites normais todos os dias.\nO addon não fará nenhuma modificação automática.',
+
+    # Travel mode messages
+    'travel_enabled': '✈️ Modo Viagem ATIVADO\n\nNovos cards estão pausados.\nEles permanecerão pausados até você desativar o Modo Viagem.',
+    'travel_disabled': '✈️ Modo Viagem DESATIVADO\n\nNovos cards serão retomados de acordo com o dia:\n• Fins de semana: Pausados\n• Dias de semana: Ativos',
+
+    # Status dialog
+    'status_title': 'Status do Weekend Addon',
+    'status_today': '<b>Hoje:</b> {}',
+    'status_travel_mode': '<b>Modo Viagem:</b> {}',
+    'status_current_mode': '<b>Modo Atual:</b> {}',
+    'status_behavior': '<b>Comportamento:</b>',
+    'status_paused_travel': '• Novos cards estão <b>pausados</b> (Modo Viagem)',
+    'status_paused_weekend': '• Novos cards estão <b>pausados</b> (Fim de semana)',
+    'status_active_weekday': '• Novos cards estão <b>ativos</b> (Dia de semana)',
+    'status_stored_limits': '<b>Limites Armazenados:</b> {} deck(s)',
+    'status_tip': '<i>Dica: Use "Alternar Modo Viagem" para pausar/retomar novos cards manualmente.</i>',
+    'status_enabled': '✅ Ativado',
+    'status_disabled': '❌ Desativado',
+
+    # Reset dialog
+    'reset_title': 'Resetar Limites Armazenados',
+    'reset_message': 'Isso limpará todos os limites originais armazenados.\n\nO addon recapturará seus limites atuais na próxima vez que pausar/retomar cards.\n\nContinuar?',
+    'reset_success': '✅ Limites armazenados limpos!\n\nO addon recapturará seus limites atuais na próxima transição fim de semana/dia de semana.',
+    'reset_error': 'Erro ao limpar limites: {}',
+
+    # Days of week
+    'monday': 'Segunda-feira',
+    'tuesday': 'Terça-feira',
+    'wednesday': 'Quarta-feira',
+    'thursday': 'Quinta-feira',
+    'friday': 'Sexta-feira',
+    'saturday': 'Sábado',
+    'sunday': 'Domingo',
+
+    # Common
+    'please_open_profile': 'Por favor, abra um perfil primeiro.',
+
+    # Mode names
+    'mode_weekday': 'Dia de semana',
+    'mode_weekend': 'Fim de semana',
+    'mode_travel': 'Viagem',
+    'mode_disabled': 'Desativado',
+    'mode_unknown': 'Ainda não aplicado',
+}
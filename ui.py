@@ -3,210 +3,404 @@ UI components for Weekend Addon v2.0
 Simple menu for toggling travel mode and viewing status.
 """
 
+from __future__ import annotations
+
+import functools
+import importlib
+from datetime import datetime
+from typing import Callable
+
 from aqt import mw
-from aqt.qt import QAction, QMenu
+from aqt.qt import QAction, QMenu, QTimer
 from aqt.utils import showInfo, tooltip
 from .i18n import tr
 
 
+# Translation keys for datetime.weekday() (0=Mon...6=Sun)
+_DAY_KEYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+_WEEKEND_DAYS = frozenset((5, 6))  # Saturday, Sunday
+
+
 # Global references for dynamic updates
 _weekend_menu = None
 _weekend_mode_action = None
 _travel_mode_action = None
 
+# (weekend_mode, travel_mode) currently shown by the menu actions
+_last_rendered = (None, None)
+
+# Full action texts indexed by state: (disabled text, enabled text)
+_WEEKEND_LABELS = ('', '')
+_TRAVEL_LABELS = ('', '')
+
+# Translated day names indexed by weekday, built on first status display
+_DAY_NAMES = None
+
+# Object name of our Tools submenu, used to find it after a module reload
+_MENU_OBJECT_NAME = "weekend_addon_menu"
+
+# Translation keys for last_applied_mode values (None: never applied)
+_MODE_KEYS = {
+    'weekday': 'mode_weekday',
+    'weekend': 'mode_weekend',
+    'travel': 'mode_travel',
+    'disabled': 'mode_disabled',
+    'unknown': 'mode_unknown',
+    None: 'mode_unknown',
+}
+
+# Status dialog layout; show_status() only fills in the variable parts
+_STATUS_TEMPLATE = (
+    "<h3>{title}</h3><br>"
+    "{today}<br><br>"
+    "<b>Modo Fim de Semana:</b> {weekend_mode}<br>"
+    "{travel_mode}<br>"
+    "{current_mode}<br><br>"
+    "{behavior_title}<br>"
+    "{behavior}<br><br>"
+    "{stored_limits}<br><br>"
+    "{tip}"
+)
+
+
+# Addon package (__init__.py), resolved once on first use. It imports this
+# module while loading, so it can't be imported at the top of this file.
+_addon = None
+
+
+def _get_addon():
+    """
+    Get the addon package module, resolving it on first call only.
+    """
+    global _addon
+    if _addon is None:
+        _addon = importlib.import_module(__package__)
+    return _addon
+
+
+def _reload(config: dict | None = None) -> bool:
+    """
+    Re-apply the current mode (as on profile open) after a UI change.
+
+    Args:
+        config: Config with unsaved changes, see on_profile_open()
+
+    Returns:
+        bool: True if on_profile_open() saved the config
+    """
+    return _get_addon().on_profile_open(config=config)
+
+
+def _apply_toggle(config: dict) -> None:
+    """
+    Save a toggled config and re-apply the mode if the toggle changed it.
+
+    If the effective mode is unchanged (e.g. travel mode toggled while
+    weekend mode is off), the config is just saved. Otherwise the mode is
+    re-applied on the next event-loop tick, so feedback (tooltip, menu
+    label) paints before decks are rewritten; on_profile_open() saves the
+    config along with the applied mode (one write), and it is saved here
+    only if on_profile_open() didn't.
+
+    Args:
+        config: Config with the unsaved toggle
+    """
+    if _get_addon()._desired_mode(config) == config.get('last_applied_mode'):
+        _save_config(config)
+        return
+
+    def run() -> None:
+        if not _reload(config):
+            _save_config(config)
+
+    QTimer.singleShot(0, run)
+
+
+def _get_config() -> dict:
+    """
+    Get the addon config from the addon's in-memory cache.
+    Shares the cache of get_config() in __init__.py, so showing the menu
+    doesn't re-parse meta.json and both modules always see the same state.
+    """
+    return _get_addon().get_config()
+
+
+def _save_config(config: dict) -> None:
+    """
+    Write the addon config to disk and keep the shared cache in sync.
+    """
+    _get_addon()._write_config(config)
+
+
+def _require_mw(fn: Callable[[], None]) -> Callable[[], None]:
+    """
+    Decorator: do nothing unless the main window exists.
+    """
+    @functools.wraps(fn)
+    def wrapper() -> None:
+        if not mw:
+            return
+        fn()
+    return wrapper
+
+
+def _require_profile(fn: Callable[[], None]) -> Callable[[], None]:
+    """
+    Decorator: ask the user to open a profile unless a collection is loaded.
+    """
+    @functools.wraps(fn)
+    def wrapper() -> None:
+        if not mw or not mw.col:
+            showInfo(tr('please_open_profile'), title=tr('menu_title'))
+            return
+        fn()
+    return wrapper
+
+
+def refresh_labels() -> None:
+    """
+    Translate the menu action labels once and cache them.
+    Call again if the UI language may have changed (e.g. after a profile switch).
+    """
+    global _WEEKEND_LABELS, _TRAVEL_LABELS, _DAY_NAMES, _last_rendered
+
+    weekend_label = tr('menu_weekend_mode')
+    travel_label = tr('menu_travel_mode')
+    _WEEKEND_LABELS = (f"❌ {weekend_label}", f"✅ {weekend_label}")
+    _TRAVEL_LABELS = (f"❌ {travel_label}", f"✅ {travel_label}")
+
+    # Force the next aboutToShow to relabel the actions
+    _last_rendered = (None, None)
+
+    # Re-translate day names on next status display
+    _DAY_NAMES = None
+
 
 def create_menu() -> None:
     """
     Create the Weekend Addon menu in Anki's Tools menu.
     Updates dynamically to show weekend and travel mode status.
     """
-    global _weekend_menu, _weekend_mode_action, _travel_mode_action
+    global _weekend_menu, _weekend_mode_action, _travel_mode_action, _last_rendered
 
     if not mw:
         return
 
+    # Tear down a menu from a previous call so signal connections and
+    # actions don't accumulate across rebuilds
+    if _weekend_menu is not None:
+        for signal in (_weekend_menu.aboutToShow, _weekend_menu.triggered):
+            try:
+                signal.disconnect()
+            except (TypeError, RuntimeError):
+                pass  # Nothing connected, or Qt object already deleted
+        mw.form.menuTools.removeAction(_weekend_menu.menuAction())
+        _weekend_menu.setParent(None)
+        _weekend_menu.deleteLater()
+        _weekend_menu = _weekend_mode_action = _travel_mode_action = None
+
+    # A reloaded module loses _weekend_menu: find leftover menus by name
+    for action in mw.form.menuTools.actions():
+        menu = action.menu()
+        if menu is not None and menu.objectName() == _MENU_OBJECT_NAME:
+            mw.form.menuTools.removeAction(action)
+            menu.deleteLater()
+
     # Get current mode status
-    config = mw.addonManager.getConfig(__name__)
-    weekend_mode = config.get('weekend_mode', True) if config else True
-    travel_mode = config.get('travel_mode', False) if config else False
+    config = _get_config()
+    weekend_mode = config.get('weekend_mode', True)
+    travel_mode = config.get('travel_mode', False)
+
+    refresh_labels()
 
     # Create main menu (no icon in title)
     _weekend_menu = QMenu(tr('menu_title'), mw)
+    _weekend_menu.setObjectName(_MENU_OBJECT_NAME)
 
     # Update menu item text dynamically when shown
-    def update_menu():
-        config = mw.addonManager.getConfig(__name__)
-
-        if _weekend_mode_action:
-            weekend_mode = config.get('weekend_mode', True) if config else True
-            icon = '✅' if weekend_mode else '❌'
-            _weekend_mode_action.setText(f"{icon} {tr('menu_weekend_mode')}")
-
-        if _travel_mode_action:
-            travel_mode = config.get('travel_mode', False) if config else False
-            icon = '✅' if travel_mode else '❌'
-            _travel_mode_action.setText(f"{icon} {tr('menu_travel_mode')}")
+    _weekend_menu.aboutToShow.connect(_on_about_to_show)
 
-    _weekend_menu.aboutToShow.connect(update_menu)
+    # One connection for all actions, dispatched by the action's data key
+    _weekend_menu.triggered.connect(_on_triggered)
 
     # Add actions (weekend mode first, then travel mode)
-    weekend_icon = '✅' if weekend_mode else '❌'
-    _weekend_mode_action = add_action(_weekend_menu, f"{weekend_icon} {tr('menu_weekend_mode')}", toggle_weekend_mode)
+    _weekend_mode_action = add_action(_weekend_menu, _WEEKEND_LABELS[bool(weekend_mode)], 'weekend_mode')
+    _travel_mode_action = add_action(_weekend_menu, _TRAVEL_LABELS[bool(travel_mode)], 'travel_mode')
 
-    travel_icon = '✅' if travel_mode else '❌'
-    _travel_mode_action = add_action(_weekend_menu, f"{travel_icon} {tr('menu_travel_mode')}", toggle_travel_mode)
-
-    add_action(_weekend_menu, tr('menu_status'), show_status)
+    add_action(_weekend_menu, tr('menu_status'), 'status')
+    _last_rendered = (weekend_mode, travel_mode)
 
     # Add menu to Tools
     mw.form.menuTools.addMenu(_weekend_menu)
 
 
-def add_action(menu: QMenu, text: str, callback) -> QAction:
+def _on_about_to_show() -> None:
+    """
+    Refresh the mode action labels right before the menu is shown.
+    Module-level (not a closure) so each rebuilt menu connects the same
+    function and disconnect() is deterministic.
+    """
+    global _last_rendered
+
+    config = _get_config()
+    weekend_mode = config.get('weekend_mode', True)
+    travel_mode = config.get('travel_mode', False)
+
+    # Skip setText() calls (and Qt signal churn) when nothing changed
+    if (weekend_mode, travel_mode) == _last_rendered:
+        return
+
+    if _weekend_mode_action:
+        _weekend_mode_action.setText(_WEEKEND_LABELS[bool(weekend_mode)])
+
+    if _travel_mode_action:
+        _travel_mode_action.setText(_TRAVEL_LABELS[bool(travel_mode)])
+
+    _last_rendered = (weekend_mode, travel_mode)
+
+
+def _on_triggered(action: QAction) -> None:
+    """
+    Run the handler for a triggered menu action.
+    Connected once per menu (QMenu.triggered) instead of once per action,
+    so no per-action slot references outlive a menu rebuild.
+
+    Args:
+        action: The triggered action, identified by its data key
+    """
+    handler = _ACTION_HANDLERS.get(action.data())
+    if handler:
+        handler()
+
+
+def add_action(menu: QMenu, text: str, key: str) -> QAction:
     """
     Add an action to a menu.
 
     Args:
         menu: The menu to add the action to
         text: The action text
-        callback: Function to call when action is triggered
+        key: Handler key in _ACTION_HANDLERS, run when the action is triggered
 
     Returns:
         The created action
     """
-    action = QAction(text, mw)
-    action.triggered.connect(callback)
+    # Parent to the menu so actions are freed along with it
+    action = QAction(text, menu)
+    action.setData(key)
     menu.addAction(action)
     return action
 
 
+@_require_mw
 def toggle_weekend_mode() -> None:
     """
     Toggle weekend mode on/off and apply changes immediately.
     """
-    if not mw:
-        return
+    global _last_rendered
 
     # Get current config
-    config = mw.addonManager.getConfig(__name__)
-    if not config:
-        config = {}
+    config = _get_config()
 
     # Toggle weekend mode
     current = config.get('weekend_mode', True)
     config['weekend_mode'] = not current
 
-    # Save config
-    mw.addonManager.writeConfig(__name__, config)
-
     # Show feedback
     message = tr('weekend_enabled') if config['weekend_mode'] else tr('weekend_disabled')
     tooltip(message, period=4000)
 
-    # Trigger immediate application by simulating profile open
-    from . import on_profile_open
-    on_profile_open()
-
     # Update menu item icon immediately
     if _weekend_mode_action:
-        icon = '✅' if config['weekend_mode'] else '❌'
-        _weekend_mode_action.setText(f"{icon} {tr('menu_weekend_mode')}")
+        _weekend_mode_action.setText(_WEEKEND_LABELS[config['weekend_mode']])
+        _last_rendered = (config['weekend_mode'], _last_rendered[1])
 
+    # Save config and apply the change if it affects the mode
+    _apply_toggle(config)
 
+
+@_require_mw
 def toggle_travel_mode() -> None:
     """
     Toggle travel mode on/off and apply changes immediately.
     """
-    if not mw:
-        return
+    global _last_rendered
 
     # Get current config
-    config = mw.addonManager.getConfig(__name__)
-    if not config:
-        config = {}
+    config = _get_config()
 
     # Toggle travel mode
     current = config.get('travel_mode', False)
     config['travel_mode'] = not current
 
-    # Save config
-    mw.addonManager.writeConfig(__name__, config)
-
     # Show feedback
     message = tr('travel_enabled') if config['travel_mode'] else tr('travel_disabled')
     tooltip(message, period=4000)
 
-    # Trigger immediate application by simulating profile open
-    from . import on_profile_open
-    on_profile_open()
-
     # Update menu item icon immediately
     if _travel_mode_action:
-        icon = '✅' if config['travel_mode'] else '❌'
-        _travel_mode_action.setText(f"{icon} {tr('menu_travel_mode')}")
+        _travel_mode_action.setText(_TRAVEL_LABELS[config['travel_mode']])
+        _last_rendered = (_last_rendered[0], config['travel_mode'])
+
+    # Save config and apply the change if it affects the mode
+    _apply_toggle(config)
 
 
+@_require_profile
 def show_status() -> None:
     """
     Show current addon status in a dialog.
     """
-    if not mw or not mw.col:
-        showInfo(tr('please_open_profile'), title=tr('menu_title'))
-        return
+    global _DAY_NAMES
 
     # Get current config
-    config = mw.addonManager.getConfig(__name__)
-    if not config:
-        config = {}
+    config = _get_config()
 
     weekend_mode = config.get('weekend_mode', True)
     travel_mode = config.get('travel_mode', False)
     last_mode = config.get('last_applied_mode', 'unknown')
-    original_limits = config.get('original_limits', {})
+
+    stored_limits_count = len(_get_addon()._get_collection_limits())
 
     # Determine current day status
-    from datetime import datetime
     weekday = datetime.now().weekday()
-    day_keys = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-    current_day = tr(day_keys[weekday])
-    is_weekend = weekday in [5, 6]  # Saturday or Sunday
+    if _DAY_NAMES is None:
+        _DAY_NAMES = tuple(tr(key) for key in _DAY_KEYS)
+    current_day = _DAY_NAMES[weekday]
+    is_weekend = weekday in _WEEKEND_DAYS
 
     # Translate mode name
-    mode_key = f'mode_{last_mode}' if last_mode else 'mode_unknown'
-    mode_name = tr(mode_key)
-
-    # Build status message
-    status_lines = [
-        f"<h3>{tr('status_title')}</h3>",
-        tr('status_today').format(current_day),
-        "",
-        f"<b>Modo Fim de Semana:</b> {tr('status_enabled') if weekend_mode else tr('status_disabled')}",
-        tr('status_travel_mode').format(tr('status_enabled') if travel_mode else tr('status_disabled')),
-        tr('status_current_mode').format(mode_name),
-        "",
-        tr('status_behavior'),
-    ]
+    mode_name = tr(_MODE_KEYS.get(last_mode, 'mode_unknown'))
+
+    # Translate shared labels once
+    enabled = tr('status_enabled')
+    disabled = tr('status_disabled')
 
+    # Current behavior line
     if not weekend_mode:
-        status_lines.append('• Addon <b>desativado</b> - sem modificações automáticas')
+        behavior = '• Addon <b>desativado</b> - sem modificações automáticas'
     elif travel_mode:
-        status_lines.append(tr('status_paused_travel'))
+        behavior = tr('status_paused_travel')
     elif is_weekend:
-        status_lines.append(tr('status_paused_weekend'))
+        behavior = tr('status_paused_weekend')
     else:
-        status_lines.append(tr('status_active_weekday'))
-
-    status_lines.extend([
-        "",
-        tr('status_stored_limits').format(len(original_limits)),
-        "",
-        tr('status_tip')
-    ])
-
-    message = "<br>".join(status_lines)
+        behavior = tr('status_active_weekday')
+
+    message = _STATUS_TEMPLATE.format(
+        title=tr('status_title'),
+        today=tr('status_today').format(current_day),
+        weekend_mode=enabled if weekend_mode else disabled,
+        travel_mode=tr('status_travel_mode').format(enabled if travel_mode else disabled),
+        current_mode=tr('status_current_mode').format(mode_name),
+        behavior_title=tr('status_behavior'),
+        behavior=behavior,
+        stored_limits=tr('status_stored_limits').format(stored_limits_count),
+        tip=tr('status_tip'),
+    )
     showInfo(message, title=tr('menu_title'), textFormat="rich")
 
 
+@_require_profile
 def reset_stored_limits() -> None:
     """
     Clear all stored original limits and force recapture on next mode change.
@@ -214,27 +408,33 @@ def reset_stored_limits() -> None:
     """
     from aqt.utils import askUser
 
-    if not mw or not mw.col:
-        showInfo(tr('please_open_profile'), title=tr('menu_title'))
-        return
-
     confirm = askUser(tr('reset_message'), title=tr('reset_title'))
 
     if not confirm:
         return
 
-    # Clear addon config
-    config = mw.addonManager.getConfig(__name__)
-    if config:
+    try:
+        # Clear collection config first; the addon config is only reset
+        # once the limits are actually gone
+        mw.col.set_config(_get_addon().COLLECTION_CONFIG_KEY, {})
+
+        # Clear addon config (legacy limits + applied mode)
+        config = _get_config()
         config['original_limits'] = {}
         config['last_applied_mode'] = None
-        mw.addonManager.writeConfig(__name__, config)
-
-    # Clear collection config
-    try:
-        mw.col.set_config("weekend_addon_original_limits", {})
-        print("[Weekend Addon] Stored limits cleared successfully")
-        tooltip(tr('reset_success'), period=4000)
+        _save_config(config)
     except Exception as e:
-        print(f"[Weekend Addon] Error clearing collection config: {e}")
+        print(f"[Weekend Addon] Error clearing stored limits: {e}")
         showInfo(tr('reset_error').format(e), title=tr('menu_title'))
+        return
+
+    print("[Weekend Addon] Stored limits cleared successfully")
+    tooltip(tr('reset_success'), period=4000)
+
+
+# Menu action handlers by data key (see add_action / _on_triggered)
+_ACTION_HANDLERS = {
+    'weekend_mode': toggle_weekend_mode,
+    'travel_mode': toggle_travel_mode,
+    'status': show_status,
+}